@@ -296,6 +296,16 @@ class TestClass(BasisTest, object):
         assert o.is3d is False
         pass
 
+    @pyaedt_unittest_check_desktop_error
+    def test_17a_create_objects_from_edges(self):
+        o = self.create_copper_cylinder()
+        edges = o.edges
+        objs = self.aedtapp.modeler.create_objects_from_edges(edges[:2])
+        assert len(objs) == 2
+        assert all(obj.object_type == "Line" for obj in objs)
+        objs = self.aedtapp.modeler.create_objects_from_edges([edges[0].id])
+        assert len(objs) == 1
+
     @pyaedt_unittest_check_desktop_error
     def test_18_create_object_from_face(self):
         o = self.create_copper_cylinder()
@@ -138,6 +138,7 @@ class TestClass(BasisTest, object):
         file_path = self.local_scratch.path
         file_name = "WBStepModel"
         assert self.aedtapp.export_3d_model(file_name, file_path, ".step", [], ["Region", "Component_Region"])
+        assert self.aedtapp.export_3d_model(file_name, file_path, ".step", [], ["Region", "Not_An_Object"])
 
     def test_08_Setup(self):
         setup_name = "DomSetup"
@@ -158,6 +159,7 @@ class TestClass(BasisTest, object):
         assert self.aedtapp.apply_icepak_settings(ambienttemp=23.5)
         self.aedtapp["amb"] = "25deg"
         assert self.aedtapp.apply_icepak_settings(ambienttemp="amb", perform_minimal_val=False)
+        assert not self.aedtapp.apply_icepak_settings(gravityDir=6)
 
     def test_11_mesh_level(self):
         assert self.aedtapp.mesh.assign_mesh_level({"USB_Shiels": 2})
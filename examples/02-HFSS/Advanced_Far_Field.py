@@ -12,6 +12,7 @@ This examples runs only on Windows using CPython.
 
 import os
 import pathlib
+import re
 
 local_path = os.path.abspath("")
 module_path = pathlib.Path(local_path)
@@ -33,6 +34,8 @@ from pyaedt.generic.general_methods import remove_project_lock
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 # This example imports all modules for postprocessing.
 
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 import matplotlib.pyplot as plt
 
@@ -79,93 +82,134 @@ end = time.time() - start
 print("Post Processing Time", end)
 
 ###############################################################################
-# Function to Calculate Far Field Values
-# --------------------------------------
-# This example generates the plot using Matplotlib by reading the solution
-# generated in ``ff_data`` and processing the field based on Phi and Theta.
+# Stack the Far Field Data per Array Element
+# ------------------------------------------
+# This example arranges the ``ff_data`` port fields on the array grid once,
+# so that the far field calculation only has to apply the phase weights.
+
+array_size = [4, 4]
+loc_offset = 2  # if array index is not starting at [1,1]
+_IDX_RE = re.compile(r"\[(\d+),(\d+)\]")  # array index "[i,j]" in the port name
+
+
+def precompute_stacks(ff_data, loc_offset, array_size, parallel_copy_threshold=100000):
+    # map each array index [i,j] to its port name
+    port_by_index = {}
+    for port in ff_data.keys():
+        index = _IDX_RE.search(port)
+        if index:
+            port_by_index[(int(index.group(1)), int(index.group(2)))] = port
+
+    # theta and phi ranges are shared by all ports
+    any_port = next(iter(ff_data))
+    theta_range = ff_data[any_port][0]
+    phi_range = ff_data[any_port][1]
+    Ntheta = theta_range.size
+    Nphi = phi_range.size
+
+    # one contiguous complex128 row per port, in array order (m, n), so that the
+    # weighting is a single matrix-vector product
+    stack_shape = (array_size[0] * array_size[1], Ntheta * Nphi)
+    stack_theta = np.empty(stack_shape, dtype=np.complex128)
+    stack_phi = np.empty(stack_shape, dtype=np.complex128)
+    rows = [
+        (m * array_size[1] + n, port_by_index[(m + 1 + loc_offset, n + 1 + loc_offset)])
+        for m in range(array_size[0])
+        for n in range(array_size[1])
+    ]
+
+    def copy_row(row):
+        row_id, port = row
+        stack_theta[row_id] = ff_data[port][2]
+        stack_phi[row_id] = ff_data[port][3]
+
+    # Copying large fields is memory bound, so it is spread over a few threads.
+    # For small fields the thread overhead is larger than the copy itself.
+    if Ntheta * Nphi >= parallel_copy_threshold:
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(copy_row, rows))
+    else:
+        for row in rows:
+            copy_row(row)
+    return stack_theta, stack_phi, Ntheta, Nphi
 
 
-def ff_calc(x=0, y=0, qty="rETotal", dB=True):
-    array_size = [4, 4]
-    loc_offset = 2  # if array index is not starting at [1,1]
-    xphase = float(y)
-    yphase = float(x)
+stack_theta, stack_phi, Ntheta, Nphi = precompute_stacks(ff_data, loc_offset, array_size)
+
+###############################################################################
+# Far Field Kernel
+# ----------------
+# This example keeps the numeric part of the calculation in a single function
+# that only works on the precomputed stacks, so each slider update costs two
+# matrix-vector products and a few element-wise operations.
+
+
+def ff_kernel(stack_theta, stack_phi, array_size, Ntheta, Nphi, xphase, yphase):
     array_shape = (array_size[0], array_size[1])
-    weight = np.zeros(array_shape, dtype=complex)
-    mag = np.ones(array_shape, dtype="object")
-    port_names_arranged = np.chararray(array_shape)
-    all_ports = ff_data.keys()
-    w_dict = {}
-    # calculate weights based off of progressive phase shift
-    for m in range(array_shape[0]):
-        for n in range(array_shape[1]):
-            mag_val = mag[m][n]
-            ang = np.radians(xphase * m) + np.radians(yphase * n)
-            weight[m][n] = np.sqrt(mag_val) * np.exp(1j * ang)
-            current_index_str = "[" + str(m + 1 + loc_offset) + "," + str(n + 1 + loc_offset) + "]"
-            port_name = [y for y in all_ports if current_index_str in y]
-            w_dict[port_name[0]] = weight[m][n]
-
-    length_of_ff_data = len(ff_data[port_name[0]][2])
-
-    array_shape = (len(w_dict), length_of_ff_data)
-    rEtheta_fields = np.zeros(array_shape, dtype=complex)
-    rEphi_fields = np.zeros(array_shape, dtype=complex)
-    w = np.zeros((1, array_shape[0]), dtype=complex)
-    # create port mapping
-    for n, port in enumerate(ff_data.keys()):
-        re_theta = ff_data[port][2]
-        re_phi = ff_data[port][3]
-        re_theta = re_theta * w_dict[port]
-
-        w[0][n] = w_dict[port]
-        re_phi = re_phi * w_dict[port]
-
-        rEtheta_fields[n] = re_theta
-        rEphi_fields[n] = re_phi
-
-        theta_range = ff_data[port][0]
-        phi_range = ff_data[port][1]
-        theta = [int(np.min(theta_range)), int(np.max(theta_range)), np.size(theta_range)]
-        phi = [int(np.min(phi_range)), int(np.max(phi_range)), np.size(phi_range)]
-        Ntheta = len(theta_range)
-        Nphi = len(phi_range)
-
-    rEtheta_fields = np.dot(w, rEtheta_fields)
-    rEtheta_fields = np.reshape(rEtheta_fields, (Ntheta, Nphi))
-
-    rEphi_fields = np.dot(w, rEphi_fields)
-    rEphi_fields = np.reshape(rEphi_fields, (Ntheta, Nphi))
+    # calculate weights based off of progressive phase shift (unit magnitude)
+    m_idx = np.arange(array_shape[0])
+    n_idx = np.arange(array_shape[1])
+    ang = np.radians(xphase) * m_idx[:, None] + np.radians(yphase) * n_idx[None, :]
+    w = np.exp(1j * ang).ravel()
+
+    # apply all weights to the precomputed stacks in a single product
+    rEtheta_fields = (w @ stack_theta).reshape(Ntheta, Nphi)
+    rEphi_fields = (w @ stack_phi).reshape(Ntheta, Nphi)
 
     all_qtys = {}
     all_qtys["rEPhi"] = rEphi_fields
     all_qtys["rETheta"] = rEtheta_fields
-    all_qtys["rETotal"] = np.sqrt(np.power(np.abs(rEphi_fields), 2) + np.power(np.abs(rEtheta_fields), 2))
+    power_total = rEphi_fields.real**2 + rEphi_fields.imag**2 + rEtheta_fields.real**2 + rEtheta_fields.imag**2
+    all_qtys["rETotal"] = np.sqrt(power_total)
+
+    pin = w.sum()
+    all_qtys["RealizedGain"] = (2 * np.pi / 377 / pin) * power_total
+    return all_qtys, pin
+
 
-    pin = np.sum(w)
+###############################################################################
+# Function to Calculate Far Field Values
+# --------------------------------------
+# This example generates the plot using Matplotlib by reading the solution
+# generated in ``ff_data`` and processing the field based on Phi and Theta.
+# The figure, image, and colorbar are created on the first call, and later
+# calls only update the image data. Reusing the figure for slider updates
+# requires an interactive Matplotlib backend such as ``%matplotlib widget``.
+# If the figure has been closed, for example by the inline backend, a new
+# one is created.
+
+_ff_plot = {}
+
+
+def _get_ff_plot():
+    if "fig" not in _ff_plot or not plt.fignum_exists(_ff_plot["fig"].number):
+        fig, ax = plt.subplots(figsize=(25, 15))
+        ax.set_xlabel("Theta (degree)")
+        ax.set_ylabel("Phi (degree)")
+        im = ax.imshow(np.zeros((Ntheta, Nphi)), cmap="jet")
+        cb = fig.colorbar(im)
+        _ff_plot.update(fig=fig, ax=ax, im=im, cb=cb)
+    return _ff_plot["fig"], _ff_plot["ax"], _ff_plot["im"], _ff_plot["cb"]
+
+
+def ff_calc(x=0, y=0, qty="rETotal", dB=True):
+    all_qtys, pin = ff_kernel(stack_theta, stack_phi, array_size, Ntheta, Nphi, float(y), float(x))
     print(str(pin))
-    real_gain = 2 * np.pi * np.abs(np.power(all_qtys["rETotal"], 2)) / pin / 377
-    all_qtys["RealizedGain"] = real_gain
 
+    qty_to_plot = np.abs(all_qtys[qty])
     if dB:
-        if "Gain" in qty:
-            qty_to_plot = 10 * np.log10(np.abs(all_qtys[qty]))
-        else:
-            qty_to_plot = 20 * np.log10(np.abs(all_qtys[qty]))
+        np.log10(qty_to_plot, out=qty_to_plot)
+        qty_to_plot *= 10.0 if "Gain" in qty else 20.0
         qty_str = qty + " (dB)"
     else:
-        qty_to_plot = np.abs(all_qtys[qty])
         qty_str = qty + " (mag)"
 
-    plt.figure(figsize=(25, 15))
-    plt.title(qty_str)
-    plt.xlabel("Theta (degree)")
-    plt.ylabel("Phi (degree)")
-
-    plt.imshow(qty_to_plot, cmap="jet")
-    plt.colorbar()
-
-    np.max(qty_to_plot)
+    fig, ax, im, cb = _get_ff_plot()
+    im.set_data(qty_to_plot)
+    im.set_clim(qty_to_plot.min(), qty_to_plot.max())
+    ax.set_title(qty_str)
+    cb.update_normal(im)
+    fig.canvas.draw_idle()
 
 
 ###############################################################################
@@ -48,10 +48,23 @@ for var_name, var_value in {
 }.items():
     q[var_name] = var_value
 
-delta_w_half = "({0}/{1})".format(cond_h, e_factor)
-sig_top_w = "({1}-{0}*2)".format(delta_w_half, sig_bot_w)
-co_gnd_top_w = "({1}-{0}*2)".format(delta_w_half, co_gnd_w)
-model_w = "{}*2+{}*2+{}".format(co_gnd_w, clearance, sig_bot_w)
+###############################################################################
+# Create derived variables
+# Derived dimensions are stored as design variables, so that AEDT evaluates
+# each expression once and the geometry only references the variable names.
+
+delta_w_half = "delta_w_half"
+sig_top_w = "sig_top_w"
+co_gnd_top_w = "co_gnd_top_w"
+model_w = "model_w"
+
+for var_name, var_value in {
+    delta_w_half: "({0}/{1})".format(cond_h, e_factor),
+    sig_top_w: "({1}-{0}*2)".format(delta_w_half, sig_bot_w),
+    co_gnd_top_w: "({1}-{0}*2)".format(delta_w_half, co_gnd_w),
+    model_w: "{}*2+{}*2+{}".format(co_gnd_w, clearance, sig_bot_w),
+}.items():
+    q[var_name] = var_value
 
 ###############################################################################
 # Create Primitives
@@ -103,10 +116,8 @@ q.modeler.create_rectangle(
 sm_obj_list = []
 for obj_name in ["signal", "co_gnd_left", "co_gnd_right"]:
     obj = q.modeler.get_object_from_name(obj_name)
-    e_obj_list = []
-    for i in [1, 2, 3]:
-        e_obj = q.modeler.create_object_from_edge(obj.edges[i])
-        e_obj_list.append(e_obj)
+    edges = obj.edges
+    e_obj_list = q.modeler.create_objects_from_edges([edges[1], edges[2], edges[3]])
     e_obj_1 = e_obj_list[0]
     q.modeler.unite(e_obj_list)
     new_obj = q.modeler.sweep_along_vector(e_obj_1.id, [0, sm_h, 0])
@@ -33,39 +33,45 @@ q = Q3d(specified_version="2022.1", non_graphical=NonGraphical, new_desktop_sess
 # ~~~~~~~~~~~~~~~~~
 # Create polylines for three busbars and a box for the substrate.
 
-b1 = q.modeler.create_polyline(
-    [[0, 0, 0], [-100, 0, 0]],
-    name="Bar1",
-    matname="copper",
-    xsection_type="Rectangle",
-    xsection_width="5mm",
-    xsection_height="1mm",
-)
-q.modeler["Bar1"].color = (255, 0, 0)
-
-q.modeler.create_polyline(
-    [[0, -15, 0], [-150, -15, 0]],
-    name="Bar2",
-    matname="aluminum",
-    xsection_type="Rectangle",
-    xsection_width="5mm",
-    xsection_height="1mm",
-)
-q.modeler["Bar2"].color = (0, 255, 0)
-
-q.modeler.create_polyline(
-    [[0, -30, 0], [-175, -30, 0], [-175, -10, 0]],
-    name="Bar3",
-    matname="copper",
-    xsection_type="Rectangle",
-    xsection_width="5mm",
-    xsection_height="1mm",
-)
-q.modeler["Bar3"].color = (0, 0, 255)
+busbars = [
+    {"position_list": [[0, 0, 0], [-100, 0, 0]], "name": "Bar1", "matname": "copper"},
+    {"position_list": [[0, -15, 0], [-150, -15, 0]], "name": "Bar2", "matname": "aluminum"},
+    {"position_list": [[0, -30, 0], [-175, -30, 0], [-175, -10, 0]], "name": "Bar3", "matname": "copper"},
+]
+for busbar in busbars:
+    q.modeler.create_polyline(xsection_type="Rectangle", xsection_width="5mm", xsection_height="1mm", **busbar)
 
 q.modeler.create_box([50, 30, -0.5], [-250, -100, -3], name="substrate", matname="FR4_epoxy")
-q.modeler["substrate"].color = (128, 128, 128)
-q.modeler["substrate"].transparency = 0.8
+
+###############################################################################
+# Set Colors and Transparency
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Apply the color and transparency of each object in a single ``ChangeProperty``
+# call, instead of issuing one call per attribute.
+
+
+def set_cosmetics(modeler, cosmetics):
+    for obj_name, props in cosmetics.items():
+        changed_props = ["NAME:ChangedProps"]
+        if "Color" in props:
+            r, g, b = props["Color"]
+            changed_props.append(["NAME:Color", "R:=", str(r), "G:=", str(g), "B:=", str(b)])
+        if "Transparent" in props:
+            changed_props.append(["NAME:Transparent", "Value:=", str(float(props["Transparent"]))])
+        modeler.oeditor.ChangeProperty(
+            ["NAME:AllTabs", ["NAME:Geometry3DAttributeTab", ["NAME:PropServers", obj_name], changed_props]]
+        )
+
+
+set_cosmetics(
+    q.modeler,
+    {
+        "Bar1": {"Color": (255, 0, 0)},
+        "Bar2": {"Color": (0, 255, 0)},
+        "Bar3": {"Color": (0, 0, 255)},
+        "substrate": {"Color": (128, 128, 128), "Transparent": 0.8},
+    },
+)
 
 q.plot(show=False, export_path=os.path.join(q.working_directory, "Q3D.jpg"), plot_air_objects=False)
 
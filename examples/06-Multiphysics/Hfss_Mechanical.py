@@ -37,6 +37,10 @@ shutil.copy2(project_full_name, project_temp_name)
 version = "2022.1"
 hfss = Hfss(project_temp_name, specified_version=version, non_graphical=False)
 pin_names = hfss.excitations
+setup0 = hfss.setups[0]
+setup_name0 = setup0.name
+sweep_name0 = setup0.sweeps[0].name
+freq0 = setup0.props["Frequency"]
 
 ###############################################################################
 # Starts Circuit
@@ -55,7 +59,7 @@ hfss_comp = circuit.modeler.schematic.add_subcircuit_dynamic_link(hfss)
 
 circuit.modeler.schematic.refresh_dynamic_link(hfss_comp.composed_name)
 circuit.modeler.schematic.set_sim_option_on_hfss_subcircuit(hfss_comp)
-hfss_setup_name = hfss.setups[0].name + " : " + hfss.setups[0].sweeps[0].name
+hfss_setup_name = setup_name0 + " : " + sweep_name0
 circuit.modeler.schematic.set_sim_solution_on_hfss_subcircuit(hfss_comp.composed_name, hfss_setup_name)
 
 ###############################################################################
@@ -65,18 +69,10 @@ circuit.modeler.schematic.set_sim_solution_on_hfss_subcircuit(hfss_comp.composed
 # Voltage source on input port.
 
 
-circuit.modeler.schematic.create_interface_port(
-    "Excitation_1", [hfss_comp.pins[0].location[0], hfss_comp.pins[0].location[1]]
-)
-circuit.modeler.schematic.create_interface_port(
-    "Excitation_2", [hfss_comp.pins[1].location[0], hfss_comp.pins[1].location[1]]
-)
-circuit.modeler.schematic.create_interface_port(
-    "Port_1", [hfss_comp.pins[2].location[0], hfss_comp.pins[2].location[1]]
-)
-circuit.modeler.schematic.create_interface_port(
-    "Port_2", [hfss_comp.pins[3].location[0], hfss_comp.pins[3].location[1]]
-)
+port_names = ["Excitation_1", "Excitation_2", "Port_1", "Port_2"]
+for port_name, pin in zip(port_names, hfss_comp.pins):
+    pin_location = pin.location
+    circuit.modeler.schematic.create_interface_port(port_name, [pin_location[0], pin_location[1]])
 
 voltage = 1
 phase = 0
@@ -124,16 +120,20 @@ mech.copy_solid_bodies_from(hfss)
 # Get losses from Hfss and assign Convection to Mechanical.
 
 
+conductors = hfss.get_all_conductors_names()
 mech.assign_em_losses(
     hfss.design_name,
-    hfss.setups[0].name,
+    setup_name0,
     "LastAdaptive",
-    hfss.setups[0].props["Frequency"],
-    surface_objects=hfss.get_all_conductors_names(),
+    freq0,
+    surface_objects=conductors,
 )
 diels = ["1_pd", "2_pd", "3_pd", "4_pd", "5_pd"]
+convection_faces = []
 for el in diels:
-    mech.assign_uniform_convection([mech.modeler[el].top_face_y, mech.modeler[el].bottom_face_y], 3)
+    obj = mech.modeler[el]
+    convection_faces.extend([obj.top_face_y, obj.bottom_face_y])
+mech.assign_uniform_convection(convection_faces, 3)
 
 
 ###############################################################################
@@ -149,9 +149,9 @@ mech.plot(show=False, export_path=os.path.join(mech.working_directory, "Mech.jpg
 mech.create_setup()
 mech.save_project()
 mech.analyze_nominal()
-surfaces = []
-for name in mech.get_all_conductors_names():
-    surfaces.extend(mech.modeler.get_object_faces(name))
+# Bodies keep their names when copied, but pec and vacuum bodies are not copied.
+mech_objects = set(mech.modeler.object_names)
+surfaces = mech.modeler.select_allfaces_fromobjects([name for name in conductors if name in mech_objects])
 mech.post.create_fieldplot_surface(surfaces, "Temperature")
 
 
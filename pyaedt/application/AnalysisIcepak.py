@@ -15,6 +15,55 @@ if is_ironpython:
 else:
     from pyaedt.modules.AdvancedPostProcessing import PostProcessor
 
+_SHERLOCK_NUM_RE = re.compile(r"[-+]?[.]?[\d]+(?:,\d\d\d)*[\.]?\d*(?:[eE][-+]?\d+)?")
+
+# Property tabs used by ``get_property_value`` for each design type.
+_TAB_BOUNDARY = {"HFSS": "HfssTab", "Icepak": "Icepak", "Q3D": "Q3D", "Maxwell3D": "Maxwell3D"}
+_TAB_EXCITATION = {"HFSS": "HfssTab", "Icepak": "Icepak", "Q3D": "Q3D", "Maxwell3D": "Maxwell3D"}
+_TAB_SETUP = {"HFSS": "HfssTab", "Icepak": "Icepak", "Q3D": "General", "Maxwell3D": "General"}
+_TAB_MESH = {"HFSS": "MeshSetupTab", "Icepak": "Icepak", "Q3D": "Q3D", "Maxwell3D": "Maxwell3D"}
+_TAB_ALL = {
+    "HFSS": ["HfssTab", "MeshSetupTab"],
+    "Icepak": ["Icepak"],
+    "Q3D": ["Q3D", "General"],
+    "Maxwell3D": ["Maxwell3D", "General"],
+}
+_PROPERTY_TABS = {"Boundary": _TAB_BOUNDARY, "Setup": _TAB_SETUP, "Excitation": _TAB_EXCITATION, "Mesh": _TAB_MESH}
+
+# Gravity vector axis and positive flag for each ``gravityDir`` index of ``apply_icepak_settings``.
+_GRAVITY_TABLE = (("X", False), ("Y", False), ("Z", False), ("X", True), ("Y", True), ("Z", True))
+
+# Sherlock CSV column, material attribute, and dataset name for each material property.
+_SHERLOCK_PROPS = [
+    ("Material Density", "mass_density", "Mass_Density"),
+    ("Thermal Conductivity", "thermal_conductivity", "Thermal_Conductivity"),
+    ("Material CTE", "thermal_expansion_coefficient", "CTE"),
+    ("Poisson Ratio", "poissons_ratio", "Poisson_Ratio"),
+    ("Elastic Modulus", "youngs_modulus", "Youngs_Modulus"),
+]
+
+
+if is_ironpython:
+
+    def _strip_temp_units(value):
+        """Remove temperature unit letters from a Sherlock temperature token."""
+        return value.replace("C", "").replace("K", "").replace("F", "")
+
+else:
+    _TEMP_UNIT_STRIP = str.maketrans("", "", "CKF")
+
+    def _strip_temp_units(value):
+        """Remove temperature unit letters from a Sherlock temperature token."""
+        return value.translate(_TEMP_UNIT_STRIP)
+
+
+def _parse_sherlock_num(value):
+    """Parse a Sherlock numeric token, falling back to the regex for tokens with units."""
+    try:
+        return float(value)
+    except ValueError:
+        return float(_SHERLOCK_NUM_RE.search(value).group(0))
+
 
 class FieldAnalysisIcepak(Analysis, object):
     """Manages 3D field analysis setup in Icepak.
@@ -247,11 +296,11 @@ class FieldAnalysisIcepak(Analysis, object):
         except:
             AmbientTemp = ambienttemp
 
-        IceGravity = ["X", "Y", "Z"]
-        GVPos = False
-        if int(gravityDir) > 2:
-            GVPos = True
-        GVA = IceGravity[int(gravityDir) - 3]
+        gravityDir = int(gravityDir)
+        if not 0 <= gravityDir < len(_GRAVITY_TABLE):
+            self.logger.error("Gravity direction index must be in the range [0, 5].")
+            return False
+        GVA, GVPos = _GRAVITY_TABLE[gravityDir]
         self.odesign.SetDesignSettings(
             [
                 "NAME:Design Settings Data",
@@ -308,13 +357,8 @@ class FieldAnalysisIcepak(Analysis, object):
         >>> oEditor.Export
         """
         if not object_list:
-            allObjects = [i for i in self.modeler.object_names]
-            if removed_objects:
-                for rem in removed_objects:
-                    allObjects.remove(rem)
-            else:
-                if "Region" in allObjects:
-                    allObjects.remove("Region")
+            removed_set = set(removed_objects) if removed_objects else {"Region"}
+            allObjects = [i for i in self.modeler.object_names if i not in removed_set]
         else:
             allObjects = self.modeler.convert_to_selections(object_list, True)
 
@@ -377,41 +421,14 @@ class FieldAnalysisIcepak(Analysis, object):
         >>> val = ipk.get_property_value('BoundarySetup:Source1', 'Total Power')
 
         """
-        boundary = {"HFSS": "HfssTab", "Icepak": "Icepak", "Q3D": "Q3D", "Maxwell3D": "Maxwell3D"}
-        excitation = {"HFSS": "HfssTab", "Icepak": "Icepak", "Q3D": "Q3D", "Maxwell3D": "Maxwell3D"}
-        setup = {"HFSS": "HfssTab", "Icepak": "Icepak", "Q3D": "General", "Maxwell3D": "General"}
-        mesh = {"HFSS": "MeshSetupTab", "Icepak": "Icepak", "Q3D": "Q3D", "Maxwell3D": "Maxwell3D"}
-        all = {
-            "HFSS": ["HfssTab", "MeshSetupTab"],
-            "Icepak": ["Icepak"],
-            "Q3D": ["Q3D", "General"],
-            "Maxwell3D": ["Maxwell3D", "General"],
-        }
-        if type == "Boundary":
-            propserv = boundary[self._design_type]
-            val = self.odesign.GetPropertyValue(propserv, objectname, property)
-            return val
-
-        elif type == "Setup":
-            propserv = setup[self._design_type]
-            val = self.odesign.GetPropertyValue(propserv, objectname, property)
-            return val
-        elif type == "Excitation":
-            propserv = excitation[self._design_type]
-            val = self.odesign.GetPropertyValue(propserv, objectname, property)
-            return val
-
-        elif type == "Mesh":
-            propserv = mesh[self._design_type]
-            val = self.odesign.GetPropertyValue(propserv, objectname, property)
-            return val
+        if type in _PROPERTY_TABS:
+            propserv = _PROPERTY_TABS[type][self._design_type]
+            return self.odesign.GetPropertyValue(propserv, objectname, property)
         else:
-            propservs = all[self._design_type]
+            propservs = _TAB_ALL[self._design_type]
             for propserv in propservs:
-                properties = list(self.odesign.GetProperties(propserv, objectname))
-                if property in properties:
-                    val = self.odesign.GetPropertyValue(propserv, objectname, property)
-                    return val
+                if property in self.odesign.GetProperties(propserv, objectname):
+                    return self.odesign.GetPropertyValue(propserv, objectname, property)
         return None
 
     @pyaedt_function_handler()
@@ -443,21 +460,16 @@ class FieldAnalysisIcepak(Analysis, object):
         >>> oEditor.Paste
         """
         body_list = design.modeler.solid_bodies
-        selection_list = []
         material_properties = design.modeler.objects
-        for body in body_list:
-            include_object = True
-            if object_list:
-                if body not in object_list:
-                    include_object = False
-            for key, val in material_properties.items():
-                if val.name == body:
-                    if no_vacuum and val.material_name == "Vacuum":
-                        include_object = False
-                    if no_pec and val.material_name == "pec":
-                        include_object = False
-            if include_object:
-                selection_list.append(body)
+        object_set = set(object_list) if object_list else None
+        excluded = set(
+            val.name
+            for val in material_properties.values()
+            if (no_vacuum and val.material_name == "Vacuum") or (no_pec and val.material_name == "pec")
+        )
+        selection_list = [
+            body for body in body_list if (object_set is None or body in object_set) and body not in excluded
+        ]
         design.modeler.oeditor.Copy(["NAME:Selections", "Selections:=", ",".join(selection_list)])
         self.modeler.oeditor.Paste()
         return True
@@ -483,6 +495,7 @@ class FieldAnalysisIcepak(Analysis, object):
         ----------
 
         >>> oEditor.AssignMaterial
+        >>> oEditor.ChangeProperty
         """
         mat = mat.lower()
         selections = self.modeler.convert_to_selections(obj, True)
@@ -495,13 +508,7 @@ class FieldAnalysisIcepak(Analysis, object):
             if mat_exists:
                 Mat.update()
             self.logger.info("Assign Material " + mat + " to object " + str(selections))
-            for el in selections:
-                self.modeler[el].material_name = mat
-                self.modeler[el].color = self.materials.material_keys[mat].material_appearance
-                if Mat.is_dielectric():
-                    self.modeler[el].solve_inside = True
-                else:
-                    self.modeler[el].solve_inside = False
+            self.modeler._assign_material_properties(selections, mat, Mat.material_appearance, Mat.is_dielectric())
             return True
         else:
             self.logger.error("Material does not exist.")
@@ -533,18 +540,16 @@ class FieldAnalysisIcepak(Analysis, object):
             self.logger.warning("Warning. The material is not the database. Use add_surface_material.")
             return False
         else:
-            for el in obj:
-                self.modeler.oeditor.ChangeProperty(
+            self.modeler.oeditor.ChangeProperty(
+                [
+                    "NAME:AllTabs",
                     [
-                        "NAME:AllTabs",
-                        [
-                            "NAME:Geometry3DAttributeTab",
-                            ["NAME:PropServers", el],
-                            ["NAME:ChangedProps", ["NAME:Surface Material", "Value:=", '"' + mat + '"']],
-                        ],
-                    ]
-                )
-
+                        "NAME:Geometry3DAttributeTab",
+                        ["NAME:PropServers"] + self.modeler.convert_to_selections(obj, True),
+                        ["NAME:ChangedProps", ["NAME:Surface Material", "Value:=", '"' + mat + '"']],
+                    ],
+                ]
+            )
             return True
 
     @pyaedt_function_handler()
@@ -573,13 +578,7 @@ class FieldAnalysisIcepak(Analysis, object):
 
             else:
                 value_splitted = val.split(",")
-                value_list = [
-                    [
-                        float(re.findall("[-+]?[.]?[\d]+(?:,\d\d\d)*[\.]?\d*(?:[eE][-+]?\d+)?", a)[0])
-                        for a in d.split("@")
-                    ]
-                    for d in value_splitted
-                ]
+                value_list = [[_parse_sherlock_num(a) for a in d.split("@")] for d in value_splitted]
                 val0 = float(value_list[0][0])
                 for el in value_list:
                     el.reverse()
@@ -593,16 +592,13 @@ class FieldAnalysisIcepak(Analysis, object):
 
     @pyaedt_function_handler()
     def _create_dataset_from_sherlock(self, material_name, material_string, property_name="Mass_Density"):
-        mats = material_string.split(",")
-        mat_temp = [[i.split("@")[0], i.split("@")[1]] for i in mats]
-        nominal_id = int(len(mat_temp) / 2)
-        nominal_val = float(mat_temp[nominal_id - 1][0])
+        pairs = [i.split("@") for i in material_string.split(",")]
+        values = [float(i[0]) for i in pairs]
+        temps = [float(_strip_temp_units(i[1])) for i in pairs]
+        nominal_id = int(len(pairs) / 2)
+        nominal_val = values[nominal_id - 1]
         ds_name = generate_unique_name(property_name)
-        self.create_dataset(
-            ds_name,
-            [float(i[1].replace("C", "").replace("K", "").replace("F", "")) for i in mat_temp],
-            [float(i[0]) / nominal_val for i in mat_temp],
-        )
+        self.create_dataset(ds_name, temps, [i / nominal_val for i in values])
         return nominal_val, "$" + ds_name
 
     @pyaedt_function_handler()
@@ -628,96 +624,40 @@ class FieldAnalysisIcepak(Analysis, object):
         >>> oEditor.AssignMaterial
         """
         with open(csv_material) as csvfile:
-            csv_input = csv.reader(csvfile)
-            material_header = next(csv_input)
-            data = list(csv_input)
-            k = 0
-            material_data = {}
-            for el in material_header:
-                material_data[el] = [i[k] for i in data]
-                k += 1
+            material_rows = list(csv.DictReader(csvfile))
         with open(csv_component) as csvfile:
-            csv_input = csv.reader(csvfile)
-            component_header = next(csv_input)
-            data = list(csv_input)
-            k = 0
-            component_data = {}
-            for el in component_header:
-                component_data[el] = [i[k] for i in data]
-                k += 1
-        all_objs = self.modeler.object_names
-        i = 0
-        for mat in material_data["Name"]:
-            list_mat_obj = [
-                "COMP_" + rd for rd, md in zip(component_data["Ref Des"], component_data["Material"]) if md == mat
-            ]
-            list_mat_obj += [rd for rd, md in zip(component_data["Ref Des"], component_data["Material"]) if md == mat]
-            list_mat_obj = [mo for mo in list_mat_obj if mo in all_objs]
+            components_by_material = {}
+            for component_data in csv.DictReader(csvfile):
+                ref_des = component_data["Ref Des"]
+                components_by_material.setdefault(component_data["Material"], []).extend(["COMP_" + ref_des, ref_des])
+        all_objs = set(self.modeler.object_names)
+        for material_data in material_rows:
+            mat = material_data["Name"]
+            list_mat_obj = [mo for mo in components_by_material.get(mat, []) if mo in all_objs]
             if list_mat_obj:
-                if not self.materials.checkifmaterialexists(mat.lower()):
-                    newmat = self.materials.add_material(mat.lower())
-                else:
-                    newmat = self.materials[mat.lower()]
-                if "Material Density" in material_data:
-                    if "@" in material_data["Material Density"][i] and "," in material_data["Material Density"][i]:
-                        nominal_val, dataset_name = self._create_dataset_from_sherlock(
-                            mat, material_data["Material Density"][i], "Mass_Density"
-                        )
-                        newmat.mass_density = nominal_val
-                        newmat.mass_density.thermalmodifier = "pwl({}, Temp)".format(dataset_name)
-                    else:
-                        value = material_data["Material Density"][i]
-                        newmat.mass_density = value
-                if "Thermal Conductivity" in material_data:
-                    if (
-                        "@" in material_data["Thermal Conductivity"][i]
-                        and "," in material_data["Thermal Conductivity"][i]
-                    ):
-                        nominal_val, dataset_name = self._create_dataset_from_sherlock(
-                            mat, material_data["Thermal Conductivity"][i], "Thermal_Conductivity"
-                        )
-                        newmat.thermal_conductivity = nominal_val
-                        newmat.thermal_conductivity.thermalmodifier = "pwl({}, Temp)".format(dataset_name)
-                    else:
-                        value = material_data["Thermal Conductivity"][i]
-                        newmat.thermal_conductivity = value
-                if "Material CTE" in material_data:
-                    if "@" in material_data["Material CTE"][i] and "," in material_data["Material CTE"][i]:
-                        nominal_val, dataset_name = self._create_dataset_from_sherlock(
-                            mat, material_data["Material CTE"][i], "CTE"
-                        )
-                        newmat.thermal_expansion_coefficient = nominal_val
-                        newmat.thermal_expansion_coefficient.thermalmodifier = "pwl({}, Temp)".format(dataset_name)
-                    else:
-                        value = material_data["Material CTE"][i]
-                        newmat.thermal_expansion_coefficient = value
-                if "Poisson Ratio" in material_data:
-                    if "@" in material_data["Poisson Ratio"][i] and "," in material_data["Poisson Ratio"][i]:
-                        nominal_val, dataset_name = self._create_dataset_from_sherlock(
-                            mat, material_data["Poisson Ratio"][i], "Poisson_Ratio"
-                        )
-                        newmat.poissons_ratio = nominal_val
-                        newmat.poissons_ratio.thermalmodifier = "pwl({}, Temp)".format(dataset_name)
+                mat_lc = mat.lower()
+                newmat = self.materials.material_keys.get(mat_lc)
+                if newmat is None:
+                    if not self.materials.checkifmaterialexists(mat_lc):
+                        newmat = self.materials.add_material(mat_lc)
                     else:
-                        value = material_data["Poisson Ratio"][i]
-                        newmat.poissons_ratio = value
-                if "Elastic Modulus" in material_data:
-                    if "@" in material_data["Elastic Modulus"][i] and "," in material_data["Elastic Modulus"][i]:
-                        nominal_val, dataset_name = self._create_dataset_from_sherlock(
-                            mat, material_data["Elastic Modulus"][i], "Youngs_Modulus"
-                        )
-                        newmat.youngs_modulus = nominal_val
-                        newmat.youngs_modulus.thermalmodifier = "pwl({}, Temp)".format(dataset_name)
+                        newmat = self.materials[mat_lc]
+                for column, attribute, dataset_property in _SHERLOCK_PROPS:
+                    value = material_data.get(column)
+                    if value is None:
+                        continue
+                    if "@" in value and "," in value:
+                        nominal_val, dataset_name = self._create_dataset_from_sherlock(mat, value, dataset_property)
+                        setattr(newmat, attribute, nominal_val)
+                        getattr(newmat, attribute).thermalmodifier = "pwl({}, Temp)".format(dataset_name)
                     else:
-                        value = material_data["Elastic Modulus"][i]
-                        newmat.youngs_modulus = value
-                self.assign_material(list_mat_obj, mat)
+                        setattr(newmat, attribute, value)
+                self.assign_material(list_mat_obj, mat_lc)
 
                 for obj_name in list_mat_obj:
                     if not self.modeler[obj_name].surface_material_name:
                         self.modeler[obj_name].surface_material_name = "Steel-oxidised-surface"
-            i += 1
-            all_objs = [ao for ao in all_objs if ao not in list_mat_obj]
+            all_objs.difference_update(list_mat_obj)
         return True
 
     @pyaedt_function_handler()
@@ -728,13 +668,16 @@ class FieldAnalysisIcepak(Analysis, object):
         -------
         list of str
             List of conductors.
+
+        References
+        ----------
+
+        >>> oDefinitionManager.GetProjectMaterialNames
+        >>> oEditor.GetObjectsByMaterial
         """
-        cond = [i.lower() for i in list(self.materials.conductors)]
-        obj_names = []
-        for el, obj in self.modeler.objects.items():
-            if obj.material_name in cond:
-                obj_names.append(obj.name)
-        return obj_names
+        cond = self.materials.conductors
+        cond = [i.lower() for i in cond]
+        return self._get_objects_by_materials(cond)
 
     @pyaedt_function_handler()
     def get_all_dielectrics_names(self):
@@ -745,10 +688,32 @@ class FieldAnalysisIcepak(Analysis, object):
         list of str
             List of dielectrics.
 
+        References
+        ----------
+
+        >>> oDefinitionManager.GetProjectMaterialNames
+        >>> oEditor.GetObjectsByMaterial
+        """
+        diel = self.materials.dielectrics
+        diel = [i.lower() for i in diel]
+        return self._get_objects_by_materials(diel)
+
+    @pyaedt_function_handler()
+    def _get_objects_by_materials(self, materials):
+        """Retrieve the objects assigned to a list of lowercase material names.
+
+        ``GetObjectsByMaterial`` is case sensitive, so each material is queried
+        with the names used in the project, such as ``"Al-Extruded"``.
         """
-        diel = [i.lower() for i in list(self.materials.dielectrics)]
+        project_names = {}
+        for name in self.materials.odefinition_manager.GetProjectMaterialNames():
+            project_names.setdefault(name.lower(), []).append(name)
         obj_names = []
-        for el, obj in self.modeler.objects.items():
-            if obj.material_name in diel:
-                obj_names.append(obj.name)
+        found = set()
+        for el in materials:
+            for name in project_names.get(el, [el]):
+                for obj_name in self.modeler.oeditor.GetObjectsByMaterial(name):
+                    if obj_name not in found:
+                        found.add(obj_name)
+                        obj_names.append(obj_name)
         return obj_names
@@ -16,6 +16,7 @@ from pyaedt.generic.general_methods import pyaedt_function_handler
 from pyaedt.modeler.GeometryOperators import GeometryOperators
 from pyaedt.modeler.Object3d import _dim_arg
 from pyaedt.modeler.Object3d import _uname
+from pyaedt.modeler.Object3d import clamp
 from pyaedt.modeler.Object3d import EdgePrimitive
 from pyaedt.modeler.Object3d import FacePrimitive
 from pyaedt.modeler.Object3d import Object3d
@@ -1104,6 +1105,36 @@ class Primitives(object):
             self.cleanup_objects()
         return True
 
+    @pyaedt_function_handler()
+    def _assign_material_properties(self, names_list, material, color, solve_inside):
+        """Assign material, color, and solve inside to objects in a single ``ChangeProperty`` call.
+
+        The cached properties of each object are updated accordingly.
+        """
+        names = self._app.modeler.convert_to_selections(names_list, True)
+        if not names:
+            return True
+        R, G, B = [clamp(int(i), 0, 255) for i in color]
+        vChangedProps = [
+            "NAME:ChangedProps",
+            ["NAME:Model", "Value:=", True],
+            ["NAME:Material", "Value:=", chr(34) + material + chr(34)],
+            ["NAME:Color", "R:=", str(R), "G:=", str(G), "B:=", str(B)],
+            ["NAME:Solve Inside", "Value:=", solve_inside],
+        ]
+        vPropServers = ["NAME:PropServers"] + names
+        vGeo3d = ["NAME:Geometry3DAttributeTab", vPropServers, vChangedProps]
+        vOut = ["NAME:AllTabs", vGeo3d]
+        _retry_ntimes(10, self._oeditor.ChangeProperty, vOut)
+        for el in names:
+            obj = self[el]
+            if obj:
+                obj._model = True
+                obj._material_name = material.lower()
+                obj._color = (R, G, B)
+                obj._solve_inside = solve_inside
+        return True
+
     @pyaedt_function_handler()
     def _change_point_property(self, vPropChange, names_list):
         names = self._app.modeler.convert_to_selections(names_list, True)
@@ -1314,6 +1345,53 @@ class Primitives(object):
             new_object_name = self._oeditor.CreateObjectFromEdges(varg1, ["NAME:Parameters", varg2])[0]
             return self._create_object(new_object_name)
 
+    @pyaedt_function_handler()
+    def create_objects_from_edges(self, edges):
+        """Create line objects from a list of edges belonging to the same object.
+
+        All edges are detached in a single call, which avoids one round trip
+        per edge.
+
+        Parameters
+        ----------
+        edges : list
+            List of edge IDs or :class:`pyaedt.modeler.Object3d.EdgePrimitive` objects.
+            All edges must belong to the same object.
+
+        Returns
+        -------
+        list of :class:`pyaedt.modeler.Object3d.Object3d`
+            List of 3D objects.
+
+        References
+        ----------
+
+        >>> oEditor.CreateObjectFromEdges
+        """
+        edge_ids = []
+        for edge in edges:
+            if isinstance(edge, EdgePrimitive):
+                edge_ids.append(edge.id)
+            else:
+                edge_ids.append(edge)
+
+        if isinstance(edges[0], EdgePrimitive):
+            obj = edges[0]._object3d.name
+        else:
+            obj = self._find_object_from_edge_id(edge_ids[0])
+
+        if obj is not None:
+
+            varg1 = ["NAME:Selections"]
+            varg1.append("Selections:="), varg1.append(obj)
+            varg1.append("NewPartsModelFlag:="), varg1.append("Model")
+
+            varg2 = ["NAME:BodyFromEdgeToParameters"]
+            varg2.append("Edges:="), varg2.append(edge_ids)
+
+            new_object_names = self._oeditor.CreateObjectFromEdges(varg1, ["NAME:Parameters", varg2])
+            return [self._create_object(name) for name in new_object_names]
+
     @pyaedt_function_handler()
     def create_object_from_face(self, face):
         """Create an object from a face.